@@ -1,12 +1,55 @@
 import asyncio
 import logging
-from typing import Dict, List, Optional, Union
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
-import aiohttp
+import msgpack
+from cachetools import TTLCache
 import numpy as np
-from web3 import Web3
-from eth_account import Account
-from eth_account.messages import encode_defunct
+import orjson
+import zstandard as zstd
+from Crypto.Hash import keccak
+
+# aiohttp, web3 and eth_account are imported where they are first needed so
+# importing the SDK stays fast
+if TYPE_CHECKING:
+    import aiohttp
+    from web3 import Web3
+
+# Bound once so the update path skips the attribute lookup
+_time = time.time
+
+# Wire/hash dtype label for arrays canonicalized by SynapseClient._quantize
+_BF16_DTYPE = "bfloat16"
+
+# Seconds between the starts of consecutive consensus ticks
+_CONSENSUS_INTERVAL = 5.0
+
+# Seconds a cached network topology is served without revalidation
+_TOPOLOGY_MAX_AGE = 30.0
+
+# Seconds a fetched node reputation is served from cache
+_REPUTATION_TTL = 30.0
+
+_MSGPACK_HEADERS = {
+    "Content-Type": "application/msgpack",
+    "Accept": "application/msgpack"
+}
+
+# Level 1 keeps compression cheap next to the cost of sending raw weight
+# buffers
+_ZSTD_LEVEL = 1
+
+# Headers for msgpack bodies compressed with SynapseClient._pack
+_MSGPACK_ZSTD_HEADERS = {**_MSGPACK_HEADERS, "Content-Encoding": "zstd"}
+
+# Requests whose msgpack responses may come back zstd-encoded advertise it.
+# They disable aiohttp's decompression and let SynapseClient._unpack decode
+# the body, so it works whether or not aiohttp has zstd support.
+_ACCEPT_ZSTD_HEADERS = {"Accept-Encoding": "zstd"}
+
+# Leading bytes of every zstd frame
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
 
 @dataclass
 class NeuralState:
@@ -15,7 +58,7 @@ class NeuralState:
     gradients: np.ndarray
     timestamp: int
     version: int
-    signature: str
+    signature: bytes
 
 @dataclass
 class ConsensusMetrics:
@@ -30,6 +73,10 @@ class SynapseClient:
     """
     Python client for Nexar AI™ Synapse Protocol
     Handles neural state synchronization and consensus participation
+    
+    Consensus canonicalizes weights and gradients on bfloat16: both the
+    state hash and the wire format use bf16-rounded values, while the
+    local neural state keeps the arrays it was given at full precision.
     """
     
     def __init__(
@@ -39,14 +86,57 @@ class SynapseClient:
         contract_address: str,
         web3_provider: str = "http://localhost:8545"
     ):
+        from eth_account import Account
+        
         self.api_url = api_url.rstrip('/')
         self.account = Account.from_key(private_key)
-        self.web3 = Web3(Web3.HTTPProvider(web3_provider))
+        self.web3_provider = web3_provider
+        self._web3: Optional["Web3"] = None
         self.contract_address = contract_address
+        # Endpoint URLs and session headers are fixed for the client's lifetime
+        self._urls = {
+            "tick": f"{self.api_url}/v1/consensus/tick",
+            "propose": f"{self.api_url}/v1/consensus/propose",
+            "sync": f"{self.api_url}/v1/neural_state/latest",
+            "state_version": f"{self.api_url}/v1/neural_state/version",
+            "update": f"{self.api_url}/v1/neural_state/update",
+            "metrics": f"{self.api_url}/v1/metrics",
+            "consensus_metrics": f"{self.api_url}/v1/consensus/metrics",
+            "topology": f"{self.api_url}/v1/network/topology"
+        }
+        self._headers = {
+            "X-API-Key": self.account.address,
+            "Connection": "keep-alive"
+        }
         self.logger = logging.getLogger("SynapseClient")
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.session: Optional["aiohttp.ClientSession"] = None
         self._neural_state: Optional[NeuralState] = None
         self._consensus_task: Optional[asyncio.Task] = None
+        # (version, timestamp, weights, gradients, hash) of the last hashed
+        # neural state; the arrays are held so they can be matched by identity
+        self._hash_cache: Optional[Tuple[int, int, np.ndarray, np.ndarray, bytes]] = None
+        # Cleared when the server does not provide the batched tick endpoint
+        self._tick_supported = True
+        # Version of the last proposal the network accepted
+        self._last_proposed_version: Optional[int] = None
+        # Shared by concurrent _sync_neural_state callers while pending
+        self._sync_inflight: Optional[asyncio.Future] = None
+        # Network version of _neural_state, -1 until a state is known
+        self._state_version_cached: int = -1
+        # Stale-while-revalidate cache for get_network_topology
+        self._topology: Optional[Dict] = None
+        self._topology_fetched_at = 0.0
+        self._topology_refresh: Optional[asyncio.Task] = None
+        # Recently fetched reputations by node address
+        self._reputation_cache: TTLCache = TTLCache(maxsize=1024, ttl=_REPUTATION_TTL)
+        
+    @property
+    def web3(self) -> "Web3":
+        """Web3 connection to web3_provider, created on first access"""
+        if self._web3 is None:
+            from web3 import Web3
+            self._web3 = Web3(Web3.HTTPProvider(self.web3_provider))
+        return self._web3
         
     async def __aenter__(self):
         """Async context manager entry"""
@@ -59,8 +149,19 @@ class SynapseClient:
         
     async def connect(self):
         """Initialize connection and start consensus participation"""
+        import aiohttp
+        
+        # Keep sockets to api_url alive across consensus ticks so requests
+        # skip TCP/TLS handshakes
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
         self.session = aiohttp.ClientSession(
-            headers={"X-API-Key": self.account.address}
+            connector=connector,
+            headers=self._headers
         )
         self._consensus_task = asyncio.create_task(self._consensus_loop())
         self.logger.info("Connected to Synapse Protocol network")
@@ -73,6 +174,11 @@ class SynapseClient:
                 await self._consensus_task
             except asyncio.CancelledError:
                 pass
+                
+        if self._topology_refresh:
+            self._topology_refresh.cancel()
+        if self._sync_inflight:
+            self._sync_inflight.cancel()
         
         if self.session:
             await self.session.close()
@@ -81,100 +187,368 @@ class SynapseClient:
         
     async def _consensus_loop(self):
         """Main consensus loop"""
+        loop = asyncio.get_running_loop()
         while True:
+            started = loop.time()
             try:
-                # Participate in consensus rounds
-                await self._participate_consensus()
-                # Update local neural state
-                await self._sync_neural_state()
-                # Submit metrics
-                await self._submit_metrics()
+                if self._tick_supported:
+                    # Propose, submit metrics and sync in one round trip
+                    await self._consensus_tick()
+                else:
+                    # Propose, sync and submit metrics concurrently; the
+                    # calls are independent within a tick
+                    results = await asyncio.gather(
+                        self._participate_consensus(),
+                        self._sync_neural_state(),
+                        self._submit_metrics(),
+                        return_exceptions=True
+                    )
+                    for result in results:
+                        if isinstance(result, Exception):
+                            self.logger.error(f"Error in consensus loop: {result}")
             except Exception as e:
                 self.logger.error(f"Error in consensus loop: {e}")
             
-            await asyncio.sleep(5)  # Consensus interval
+            # Sleep out the rest of the interval so the cadence stays fixed
+            # however long the tick took
+            elapsed = loop.time() - started
+            await asyncio.sleep(max(0.0, _CONSENSUS_INTERVAL - elapsed))
+            
+    async def _consensus_tick(self):
+        """
+        Run one consensus round through the batched tick endpoint
+        
+        POST /v1/consensus/tick takes a msgpack body of
+        {"proposal": <proposal, omitted without a new local state>, "metrics": {...},
+        "known_version": <version of the local state, -1 if none>}
+        and answers with {"neural_state": <serialized neural state>}. The
+        server may leave out neural_state when its version equals
+        known_version. Servers without the endpoint return 404, after which
+        the loop falls back to the single-purpose endpoints.
+        """
+        payload = {
+            "metrics": self._collect_metrics(),
+            "known_version": self._state_version_cached
+        }
+        state = self._neural_state
+        proposing = bool(state) and state.version != self._last_proposed_version
+        if proposing:
+            body = await self._build_proposal(state, payload)
+            headers = _MSGPACK_ZSTD_HEADERS
+        else:
+            # Idle ticks carry only metrics, too small to be worth compressing
+            body = msgpack.packb(payload)
+            headers = _MSGPACK_HEADERS
+            
+        async with self.session.post(
+            self._urls["tick"],
+            data=body,
+            headers={**headers, **_ACCEPT_ZSTD_HEADERS},
+            auto_decompress=False
+        ) as resp:
+            if resp.status == 404:
+                self.logger.info("Batched consensus tick unavailable, using single-purpose endpoints")
+                self._tick_supported = False
+                return
+            if resp.status != 200:
+                raise Exception(f"Failed to run consensus tick: {await self._error_text(resp)}")
+                
+            if proposing:
+                self._last_proposed_version = state.version
+            # Decoding scales with the state size, so it runs off the loop
+            new_state = await asyncio.to_thread(
+                self._unpack_neural_state, await resp.read(), "neural_state"
+            )
+            if new_state:
+                self._set_neural_state(new_state)
             
+    async def _build_proposal(self, state: NeuralState, payload: Optional[Dict] = None) -> bytes:
+        """
+        Sign a neural state and pack a consensus proposal body for it
+        
+        With a payload, the proposal is added to it under "proposal" and the
+        whole payload is packed; otherwise the proposal is the body.
+        """
+        # Quantizing, hashing, signing, serializing and compressing scale with
+        # the state size, so they run in worker threads to keep the event loop
+        # responsive. The bf16 bits are computed once for hash and body.
+        quantized = await asyncio.to_thread(self._quantize_state, state)
+        message = await asyncio.to_thread(self._hash_neural_state, state, quantized)
+        signature = await asyncio.to_thread(self._sign_message, message)
+        return await asyncio.to_thread(
+            self._pack_proposal, state, quantized, signature, payload
+        )
+        
+    def _pack_proposal(
+        self,
+        state: NeuralState,
+        quantized: Tuple[np.ndarray, np.ndarray],
+        signature: bytes,
+        payload: Optional[Dict] = None
+    ) -> bytes:
+        """Serialize and compress a proposal body, see _build_proposal"""
+        proposal = {
+            "neural_state": self._serialize_neural_state(state, quantized),
+            "signature": signature
+        }
+        if payload is None:
+            return self._pack(proposal)
+        return self._pack({**payload, "proposal": proposal})
+        
     async def _participate_consensus(self):
         """Participate in neural state consensus"""
-        if not self._neural_state:
+        state = self._neural_state
+        # Nothing to do without a state or if this version was already accepted
+        if not state or state.version == self._last_proposed_version:
             return
             
-        # Sign current neural state
-        message = self._hash_neural_state(self._neural_state)
-        signature = self._sign_message(message)
-        
-        # Submit to consensus
+        # Submit signed current neural state to consensus
         async with self.session.post(
-            f"{self.api_url}/v1/consensus/propose",
-            json={
-                "neural_state": self._serialize_neural_state(self._neural_state),
-                "signature": signature
-            }
+            self._urls["propose"],
+            data=await self._build_proposal(state),
+            headers=_MSGPACK_ZSTD_HEADERS
         ) as resp:
             if resp.status != 200:
                 raise Exception(f"Failed to submit consensus proposal: {await resp.text()}")
                 
-    def _hash_neural_state(self, state: NeuralState) -> bytes:
-        """Create hash of neural state"""
-        # Combine weights and gradients into single array
-        combined = np.concatenate([
-            state.weights.flatten(),
-            state.gradients.flatten()
-        ])
-        # Create deterministic byte representation
-        state_bytes = combined.tobytes()
+            self._last_proposed_version = state.version
+                
+    def _pack(self, payload: Dict) -> bytes:
+        """Encode a large request body as zstd-compressed msgpack"""
+        # Compressors are not thread-safe and this runs in worker threads,
+        # so each call gets its own
+        compressor = zstd.ZstdCompressor(level=_ZSTD_LEVEL)
+        return compressor.compress(msgpack.packb(payload))
+        
+    def _unpack(self, body: bytes) -> Dict:
+        """Decode a msgpack response body, decompressing it if it is zstd"""
+        # Servers may answer zstd or identity, so check the frame magic
+        return msgpack.unpackb(self._decompress(body), raw=False)
+        
+    @staticmethod
+    def _decompress(body: bytes) -> bytes:
+        """Undo zstd compression of a body if it is a zstd frame"""
+        if body[:4] != _ZSTD_MAGIC:
+            return body
+        # Decompressors are not thread-safe either, see _pack. A decompressobj
+        # also handles frames without a content size, as written by
+        # streaming HTTP encoders.
+        return zstd.ZstdDecompressor().decompressobj().decompress(body)
+        
+    async def _error_text(self, resp) -> str:
+        """Read an error body from a request made with auto_decompress=False"""
+        body = self._decompress(await resp.read())
+        return body.decode(resp.charset or "utf-8", errors="replace")
+        
+    def _unpack_neural_state(self, body: bytes, key: Optional[str] = None) -> Optional[NeuralState]:
+        """
+        Decode a msgpack response body carrying a neural state
+        
+        With a key, the state is read from that field of the response and
+        None is returned when the field is absent.
+        """
+        data = self._unpack(body)
+        if key is not None:
+            if key not in data:
+                return None
+            data = data[key]
+        return self._deserialize_neural_state(data)
+        
+    def _hash_neural_state(
+        self,
+        state: NeuralState,
+        quantized: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> bytes:
+        """Create hash of neural state, optionally from its _quantize_state bits"""
+        # Version and timestamp alone can collide, e.g. a retried update or a
+        # network state built in the same second, so the arrays must match too.
+        # Identity only proves the contents are unchanged for read-only arrays
+        # (decoded states); caller buffers may be mutated in place.
+        frozen = not state.weights.flags.writeable and not state.gradients.flags.writeable
+        cache = self._hash_cache
+        if (frozen and cache and cache[0] == state.version
+                and cache[1] == state.timestamp
+                and cache[2] is state.weights and cache[3] is state.gradients):
+            return cache[4]
+            
+        # Absorb the bf16-canonical weights and gradients from their buffers
+        if quantized is None:
+            quantized = self._quantize_state(state)
+        weights, gradients = quantized
+        h = keccak.new(digest_bits=256)
+        # Flatten first: memoryview cannot cast empty multi-dimensional views.
+        # The quantized arrays are contiguous, so reshape does not copy.
+        h.update(memoryview(weights.reshape(-1)).cast('B'))
+        h.update(memoryview(gradients.reshape(-1)).cast('B'))
         # Add metadata
-        metadata = f"{state.timestamp}:{state.version}".encode()
-        return Web3.keccak(state_bytes + metadata)
+        h.update(f"{state.timestamp}:{state.version}".encode())
+        digest = h.digest()
+        if frozen:
+            self._hash_cache = (
+                state.version, state.timestamp, state.weights, state.gradients, digest
+            )
+        return digest
         
-    def _sign_message(self, message: bytes) -> str:
+    def _sign_message(self, message: bytes) -> bytes:
         """Sign a message with the node's private key"""
+        from eth_account.messages import encode_defunct
+        
         message_hash = encode_defunct(message)
-        signed = self.web3.eth.account.sign_message(
-            message_hash,
-            private_key=self.account.key
-        )
-        return signed.signature.hex()
+        signed = self.account.sign_message(message_hash)
+        # Raw bytes travel as msgpack bin, half the size of a hex string
+        return bytes(signed.signature)
         
-    def _serialize_neural_state(self, state: NeuralState) -> Dict:
-        """Serialize neural state for transmission"""
+    def _serialize_neural_state(
+        self,
+        state: NeuralState,
+        quantized: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> Dict:
+        """Serialize neural state for transmission, optionally from its _quantize_state bits"""
+        if quantized is None:
+            quantized = self._quantize_state(state)
+        weights, gradients = quantized
         return {
-            "weights": state.weights.tolist(),
-            "gradients": state.gradients.tolist(),
+            "weights": self._encode_array(weights),
+            "gradients": self._encode_array(gradients),
             "timestamp": state.timestamp,
             "version": state.version,
             "signature": state.signature
         }
         
+    def _pack_neural_state(
+        self,
+        state: NeuralState,
+        quantized: Tuple[np.ndarray, np.ndarray]
+    ) -> bytes:
+        """Serialize and compress a neural state update body"""
+        return self._pack(self._serialize_neural_state(state, quantized))
+        
+    def _deserialize_neural_state(self, data: Dict) -> NeuralState:
+        """Rebuild a neural state produced by _serialize_neural_state"""
+        return NeuralState(
+            weights=self._decode_array(data["weights"]),
+            gradients=self._decode_array(data["gradients"]),
+            timestamp=data["timestamp"],
+            version=data["version"],
+            signature=data["signature"]
+        )
+        
+    def _quantize_state(self, state: NeuralState) -> Tuple[np.ndarray, np.ndarray]:
+        """bfloat16 bits of a state's weights and gradients"""
+        return self._quantize(state.weights), self._quantize(state.gradients)
+        
+    @staticmethod
+    def _quantize(arr: np.ndarray) -> np.ndarray:
+        """Round an array to bfloat16, returned as little-endian uint16 bits"""
+        arr = np.asarray(arr, dtype=np.float32, order='C')
+        bits = arr.view(np.uint32)
+        # Round to nearest even before dropping the low 16 mantissa bits,
+        # in place on a single uint32 temporary
+        rounded = np.empty_like(bits)
+        np.right_shift(bits, 16, out=rounded)
+        rounded &= 1
+        rounded += 0x7FFF
+        rounded += bits
+        rounded >>= 16
+        # Keep NaNs as a canonical quiet NaN rather than rounding into inf
+        rounded[np.isnan(arr)] = 0x7FC0
+        return rounded.astype('<u2')
+        
+    @staticmethod
+    def _dequantize(bits: np.ndarray) -> np.ndarray:
+        """Widen bfloat16 bits produced by _quantize back to float32"""
+        return (bits.astype(np.uint32) << 16).view(np.float32)
+        
+    @staticmethod
+    def _encode_array(bits: np.ndarray) -> Dict:
+        """Encode bfloat16 bits from _quantize plus a dtype/shape header"""
+        return {
+            "dtype": _BF16_DTYPE,
+            "shape": list(bits.shape),
+            "buf": bits.tobytes()
+        }
+        
+    @classmethod
+    def _decode_array(cls, data: Dict) -> np.ndarray:
+        """
+        Decode an array produced by _encode_array
+        
+        The buffer is read with np.frombuffer, never element by element.
+        The result is read-only either way: neural states are replaced
+        wholesale, and the cached state hash assumes their arrays never
+        change in place. Callers that need to mutate must copy first.
+        """
+        shape = tuple(data["shape"])
+        if data["dtype"] == _BF16_DTYPE:
+            bits = np.frombuffer(data["buf"], dtype='<u2')
+            arr = cls._dequantize(bits).reshape(shape)
+            arr.flags.writeable = False
+            return arr
+        # Any other dtype is a zero-copy view of the (immutable) payload
+        return np.frombuffer(
+            data["buf"],
+            dtype=np.dtype(data["dtype"])
+        ).reshape(shape)
+        
+    def _set_neural_state(self, state: NeuralState):
+        """Replace the local neural state and record its network version"""
+        self._neural_state = state
+        self._state_version_cached = state.version
+        
     async def _sync_neural_state(self):
         """Sync neural state with network"""
+        # Concurrent callers wait on the pending sync instead of issuing
+        # their own downloads. Each waits through a shield so cancelling one
+        # caller does not cancel the download for the others; the sync stays
+        # shared until it is done, even if the caller that started it left.
+        inflight = self._sync_inflight
+        if inflight is None or inflight.done():
+            inflight = asyncio.ensure_future(self._do_sync_neural_state())
+            # Retrieve the outcome so a sync whose waiters were all cancelled
+            # does not log "exception was never retrieved"
+            inflight.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._sync_inflight = inflight
+        return await asyncio.shield(inflight)
+                
+    async def _do_sync_neural_state(self):
+        """Fetch the network neural state if its version changed"""
+        # Probe the cheap version endpoint first and keep the cached state
+        # when nothing changed, skipping the full state download
+        async with self.session.get(self._urls["state_version"]) as resp:
+            if resp.status != 200:
+                raise Exception(f"Failed to get neural state version: {await resp.text()}")
+            version = orjson.loads(await resp.read())["version"]
+            
+        if version == self._state_version_cached:
+            return
+            
         async with self.session.get(
-            f"{self.api_url}/v1/neural_state/latest"
+            self._urls["sync"],
+            headers={**_MSGPACK_HEADERS, **_ACCEPT_ZSTD_HEADERS},
+            auto_decompress=False
         ) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to sync neural state: {await resp.text()}")
+                raise Exception(f"Failed to sync neural state: {await self._error_text(resp)}")
                 
-            data = await resp.json()
-            self._neural_state = NeuralState(
-                weights=np.array(data["weights"]),
-                gradients=np.array(data["gradients"]),
-                timestamp=data["timestamp"],
-                version=data["version"],
-                signature=data["signature"]
-            )
+            # Decoding scales with the state size, so it runs off the loop
+            new_state = await asyncio.to_thread(self._unpack_neural_state, await resp.read())
+            self._set_neural_state(new_state)
             
-    async def _submit_metrics(self):
-        """Submit node metrics to network"""
-        metrics = {
+    def _collect_metrics(self) -> Dict:
+        """Collect node metrics for submission"""
+        return {
             "cpu_utilization": self._get_cpu_utilization(),
             "memory_usage": self._get_memory_usage(),
             "neural_compute": self._get_neural_compute(),
             "bandwidth": self._get_bandwidth_usage()
         }
         
+    async def _submit_metrics(self):
+        """Submit node metrics to network"""
         async with self.session.post(
-            f"{self.api_url}/v1/metrics",
-            json=metrics
+            self._urls["metrics"],
+            data=msgpack.packb(self._collect_metrics()),
+            headers=_MSGPACK_HEADERS
         ) as resp:
             if resp.status != 200:
                 self.logger.warning(f"Failed to submit metrics: {await resp.text()}")
@@ -202,12 +576,12 @@ class SynapseClient:
     async def get_consensus_metrics(self) -> ConsensusMetrics:
         """Get current consensus metrics"""
         async with self.session.get(
-            f"{self.api_url}/v1/consensus/metrics"
+            self._urls["consensus_metrics"]
         ) as resp:
             if resp.status != 200:
                 raise Exception(f"Failed to get metrics: {await resp.text()}")
                 
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             return ConsensusMetrics(
                 total_nodes=data["total_nodes"],
                 active_nodes=data["active_nodes"],
@@ -230,40 +604,81 @@ class SynapseClient:
         state = NeuralState(
             weights=weights,
             gradients=gradients,
-            timestamp=int(time.time()),
+            timestamp=int(_time()),
             version=self._neural_state.version + 1 if self._neural_state else 0,
-            signature=""  # Will be set below
+            signature=b""  # Will be set below
         )
         
-        # Sign the state
-        message = self._hash_neural_state(state)
-        state.signature = self._sign_message(message)
+        # Sign the state, quantizing it once for both hash and body
+        quantized = await asyncio.to_thread(self._quantize_state, state)
+        message = await asyncio.to_thread(self._hash_neural_state, state, quantized)
+        state.signature = await asyncio.to_thread(self._sign_message, message)
+        body = await asyncio.to_thread(self._pack_neural_state, state, quantized)
         
         # Submit update
         async with self.session.post(
-            f"{self.api_url}/v1/neural_state/update",
-            json=self._serialize_neural_state(state)
+            self._urls["update"],
+            data=body,
+            headers=_MSGPACK_ZSTD_HEADERS
         ) as resp:
             if resp.status != 200:
                 raise Exception(f"Failed to submit update: {await resp.text()}")
                 
-            self._neural_state = state
+            self._set_neural_state(state)
             
     async def get_network_topology(self) -> Dict:
-        """Get current network topology"""
+        """
+        Get current network topology
+        
+        The topology is cached. Once it is older than _TOPOLOGY_MAX_AGE the
+        stale copy is still returned immediately while a background task
+        fetches a fresh one.
+        """
+        if self._topology is None:
+            return await self._fetch_network_topology()
+            
+        age = asyncio.get_running_loop().time() - self._topology_fetched_at
+        refreshing = self._topology_refresh and not self._topology_refresh.done()
+        if age > _TOPOLOGY_MAX_AGE and not refreshing:
+            self._topology_refresh = asyncio.create_task(self._revalidate_network_topology())
+        return self._topology
+        
+    async def _fetch_network_topology(self) -> Dict:
+        """Fetch the network topology and store it in the cache"""
         async with self.session.get(
-            f"{self.api_url}/v1/network/topology"
+            self._urls["topology"]
         ) as resp:
             if resp.status != 200:
                 raise Exception(f"Failed to get topology: {await resp.text()}")
-            return await resp.json()
+            topology = orjson.loads(await resp.read())
+            
+        self._topology = topology
+        self._topology_fetched_at = asyncio.get_running_loop().time()
+        return topology
+        
+    async def _revalidate_network_topology(self):
+        """Refresh the cached topology in the background"""
+        try:
+            await self._fetch_network_topology()
+        except Exception as e:
+            self.logger.warning(f"Failed to refresh network topology: {e}")
             
     async def get_node_reputation(self, node_address: str) -> float:
-        """Get reputation score for a node"""
+        """Get reputation score for a node, cached for _REPUTATION_TTL seconds"""
+        reputation = self._reputation_cache.get(node_address)
+        if reputation is not None:
+            return reputation
+            
         async with self.session.get(
             f"{self.api_url}/v1/nodes/{node_address}/reputation"
         ) as resp:
             if resp.status != 200:
                 raise Exception(f"Failed to get reputation: {await resp.text()}")
-            data = await resp.json()
-            return data["reputation"] 
\ No newline at end of file
+            data = orjson.loads(await resp.read())
+            
+        self._reputation_cache[node_address] = data["reputation"]
+        return data["reputation"]
+        
+    def invalidate_reputation(self, node_address: str):
+        """Drop a node's cached reputation so the next lookup refetches it"""
+        self._reputation_cache.pop(node_address, None) 
\ No newline at end of file